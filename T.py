@@ -38,17 +38,35 @@ Output:
 Notes:
 - If fewer than 10 businesses found for a category, add a row:
   "Less than 10 records available for this category"
+- Directory and Yelp pages are cached in scrape_cache.sqlite for 24 hours
+  so an interrupted run can be resumed cheaply; pass --no-cache to clear it
+  and refetch everything
 """
 
-import requests
+import argparse
+import asyncio
+import aiohttp
+from aiohttp_client_cache import CachedSession, SQLiteBackend
+from aiolimiter import AsyncLimiter
 from bs4 import BeautifulSoup
-import pandas as pd
+import soupsieve as sv
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+import xlsxwriter
 import re
-import time
 import random
-from urllib.parse import urljoin, quote_plus
+from collections import OrderedDict, namedtuple
+from contextlib import asynccontextmanager
+from urllib.parse import urljoin, quote_plus, urlparse
 import logging
 
+try:
+    import lxml  # noqa: F401 - only needed as the BeautifulSoup tree builder
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
 # -----------------------------
 # CONFIGURATION
 # -----------------------------
@@ -88,97 +106,376 @@ REGIONS = {
     }
 }
 
+# Search URL templates per source, filled with URL-encoded search terms
+SEARCH_URL_TEMPLATES = {
+    "yellowpages_us": "https://www.yellowpages.com/search?search_terms={category}&geo_location_terms={location}",
+    "yellowpages_ca": "https://www.yellowpages.ca/search/si/1/{category}/{location}",
+    "yelp_us": "https://www.yelp.com/search?find_desc={category}&find_loc={location}",
+    "yelp_ca": "https://www.yelp.ca/search?find_desc={category}&find_loc={location}"
+}
+
+# URL-encoded search terms, pre-filled for every category
+_encoded_terms = {category: quote_plus(category) for category in CATEGORIES}
+
+# Browser user agents rotated across requests
+USER_AGENTS = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:89.0) Gecko/20100101 Firefox/89.0"
+)
+
+# Headers sent with every request, set once on the session. Only encodings
+# aiohttp can decode without extra packages are advertised
+SESSION_HEADERS = {
+    "Accept-Encoding": "gzip, deflate",
+    "Accept-Language": "en-US,en;q=0.9"
+}
+
+# Per-agent header dicts built once, so rotating the agent allocates nothing
+_UA_HEADERS = tuple({"User-Agent": user_agent} for user_agent in USER_AGENTS)
+
+# Output columns, in spreadsheet order
+COLUMNS = ["Business Name", "Email", "Phone", "Website", "Address", "Category"]
+PARQUET_SCHEMA = pa.schema([(column, pa.string()) for column in COLUMNS])
+
+# One scraped business; fields are in COLUMNS order
+Business = namedtuple('Business', 'name email phone website address category')
+
+# On-disk HTTP cache, so reruns skip pages fetched within the last day
+CACHE_PATH = "scrape_cache.sqlite"
+CACHE_EXPIRE_AFTER = 24 * 60 * 60  # Seconds
+
+# Concurrency / politeness settings
+MAX_CONCURRENT_REQUESTS = 10  # Global cap on in-flight requests
+DOMAIN_DELAY = 1.5  # Minimum seconds between requests to the same host
+
+_request_semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+_domain_limiters = {}
+_domain_locks = {}
+
+# In-memory fetch cache: (kind, URL) -> Future of the result, oldest first.
+# Page fetches only stay here while in flight; email lookups are kept
+PAGE_CACHE_SIZE = 2000
+_page_cache = OrderedDict()
+
+# Streaming email scan settings for external business websites
+EMAIL_SCAN_CHUNK_SIZE = 8192
+EMAIL_SCAN_INTERVAL = 16384  # Bytes to buffer between regex scans
+EMAIL_SCAN_MAX_BYTES = 500_000  # Give up on pages larger than this
+EMAIL_SCAN_OVERLAP = 256  # Re-scan this much so an email split across chunks is found
+
+# Pages of a business website most likely to list an email, in the order tried
+CONTACT_PATHS = ('', '/contact', '/contact-us', '/about')
+
+# Pre-compiled regex patterns
+EMAIL_RE = re.compile(r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}", re.I)
+# US/Canada phone number with an optional literal +1 country code. A number
+# starting with a bare digit must not follow another digit, so a zip code or
+# suite number run into it by get_text() isn't absorbed
+PHONE_RE = re.compile(r"(?:\+1[-.\s]?\(?|\(|(?<!\d))\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}")
+WS_RE = re.compile(r"\s+")
+WEBSITE_RE = re.compile(r"website", re.I)
+PHONE_PAREN_RE = re.compile(r"\(\d{3}\)")
+PHONE_DASH_RE = re.compile(r"\d{3}-\d{3}-\d{4}")
+BIZ_REDIR_RE = re.compile(r"biz_redir")
+STREET_RE = re.compile(r"\d+.*(?:St|Ave|Rd|Blvd|Dr|Ln)")
+
+# Email and phone alternatives folded into one pattern so a single scan
+# finds both (mailto: links are covered by the plain email alternative)
+CONTACT_RE = re.compile(f"(?P<email>{EMAIL_RE.pattern})|(?P<phone>{PHONE_RE.pattern})", re.I)
+
+# Pre-compiled CSS selectors. Alternatives for a field are kept as a tuple
+# tried in priority order (a union selector would return whichever element
+# comes first in the document, e.g. the ranked <h2> over the name link)
+YP_US_LISTING_SEL = sv.compile('div.info')
+YP_US_NAME_SELS = (sv.compile('a.business-name'), sv.compile('h2'), sv.compile('h3'))
+YP_US_PHONE_SELS = (sv.compile('div.phones.phone.primary'), sv.compile('div.phone'))
+YP_US_WEBSITE_SELS = (sv.compile('a.track-visit-website'), sv.compile('a[href]'))
+YP_US_ADDRESS_SEL = sv.compile('div.street-address, span.street-address')
+
+YP_CA_LISTING_SELS = (sv.compile('div.listing'), sv.compile('div.listing__content'))
+YP_CA_NAME_SELS = (sv.compile('h3.listing__name'), sv.compile('a.listing__name--link'))
+YP_CA_PHONE_SELS = (sv.compile('a.phone'), sv.compile('div.listing__phone'))
+YP_CA_WEBSITE_SEL = sv.compile('a.listing__website')
+YP_CA_ADDRESS_SELS = (sv.compile('div.listing__address'), sv.compile('span.address'))
+
+YELP_LISTING_SELS = (sv.compile('div[data-testid="serp-ia-card"]'), sv.compile('li.regular-search-result'))
+YELP_NAME_SELS = (sv.compile('a.css-1m051bw'), sv.compile('span.css-1egxyvc'))
+
+MAILTO_SEL = sv.compile('a[href^="mailto:" i]')
+
 # -----------------------------
 # HELPER FUNCTIONS
 # -----------------------------
 
 def get_headers():
     """Return random user agent headers"""
-    user_agents = [
-        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-        "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:89.0) Gecko/20100101 Firefox/89.0"
-    ]
-    return {"User-Agent": random.choice(user_agents)}
+    return random.choice(_UA_HEADERS)
+
+def encode_term(term):
+    """Return the URL-encoded form of a search term, encoding each term once"""
+    encoded = _encoded_terms.get(term)
+    if encoded is None:
+        encoded = _encoded_terms[term] = quote_plus(term)
+    return encoded
 
-def fetch_page(url, timeout=10):
-    """Fetch HTML content with headers + delay"""
+def url_for(source, category, location):
+    """Build the search URL for a source, category and location"""
+    return SEARCH_URL_TEMPLATES[source].format(
+        category=encode_term(category),
+        location=encode_term(location)
+    )
+
+def limiter_for(url):
+    """Return the rate limiter for the URL's host (one request per DOMAIN_DELAY)"""
+    host = urlparse(url).netloc
+    limiter = _domain_limiters.get(host)
+    if limiter is None:
+        limiter = _domain_limiters[host] = AsyncLimiter(1, DOMAIN_DELAY)
+    return limiter
+
+@asynccontextmanager
+async def request_slot(url, throttle=True):
+    """Hold a global request slot, sent at least DOMAIN_DELAY after the last request to the host"""
+    if not throttle:
+        async with _request_semaphore:
+            yield
+        return
+    
+    host = urlparse(url).netloc
+    lock = _domain_locks.get(host)
+    if lock is None:
+        lock = _domain_locks[host] = asyncio.Lock()
+    
+    # Requests to the same host queue on its lock, outside the semaphore, so a
+    # host waiting out its delay holds at most one global slot. The limiter
+    # is taken only once the slot is held, right before the request is sent,
+    # so requests queued behind the global cap can't fire together
+    async with lock:
+        await _request_semaphore.acquire()
+        try:
+            await limiter_for(url).acquire()
+        except BaseException:
+            _request_semaphore.release()
+            raise
+    
     try:
-        headers = get_headers()
-        time.sleep(random.uniform(1, 3))  # Polite delay
+        yield
+    finally:
+        _request_semaphore.release()
+
+async def is_cached(session, url):
+    """Return True if the session's on-disk cache holds an unexpired response for url"""
+    cache = getattr(session, 'cache', None)
+    if cache is None:
+        return False
+    # has_url() ignores expiry; get_response() returns None for stale entries,
+    # which CachedSession would refetch from the network
+    return await cache.get_response(cache.create_key('GET', url)) is not None
+
+async def _do_fetch(session, url, timeout=10):
+    """Fetch HTML content with headers + per-domain delay"""
+    try:
+        # Cached pages don't touch the host, so they skip the politeness delay
+        throttle = not await is_cached(session, url)
         
-        logger.info(f"Fetching: {url}")
-        response = requests.get(url, headers=headers, timeout=timeout)
-        response.raise_for_status()
-        return response.text
-    except requests.RequestException as e:
+        async with request_slot(url, throttle):
+            logger.info(f"Fetching: {url}")
+            async with session.get(url, headers=get_headers(),
+                                   timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+                response.raise_for_status()
+                return await response.text(errors='replace')
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
         logger.error(f"Error fetching {url}: {e}")
         return None
 
-def extract_email_from_text(text):
-    """Extract first email found in text"""
-    if not text:
-        return None
+def _drop_cache_entry(key, future):
+    """Remove key from the fetch cache if it still maps to future"""
+    if _page_cache.get(key) is future:
+        del _page_cache[key]
+
+async def _shared_fetch(key, fetch, keep_result=True):
+    """Run fetch() once per key, sharing the result with every caller of the same key"""
+    future = _page_cache.get(key)
+    if future is not None:
+        _page_cache.move_to_end(key)
+        # Shield so a cancelled waiter does not cancel the shared fetch
+        return await asyncio.shield(future)
     
-    # Common email patterns
-    email_patterns = [
-        r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}",
-        r"mailto:([A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,})"
-    ]
+    future = asyncio.get_running_loop().create_future()
+    _page_cache[key] = future
+    if len(_page_cache) > PAGE_CACHE_SIZE:
+        _page_cache.popitem(last=False)
     
-    for pattern in email_patterns:
-        emails = re.findall(pattern, text, re.IGNORECASE)
-        if emails:
-            return emails[0] if isinstance(emails[0], str) else emails[0][0]
+    try:
+        result = await fetch()
+    except asyncio.CancelledError:
+        # Drop the entry so a later caller can retry the URL
+        _drop_cache_entry(key, future)
+        future.cancel()
+        raise
+    except Exception as e:
+        _drop_cache_entry(key, future)
+        # Waiters get the same error; retrieve it so an unawaited future
+        # doesn't log "exception was never retrieved"
+        future.set_exception(e)
+        future.exception()
+        raise
+    
+    # Results not worth keeping (whole pages) are only shared while in flight
+    if not keep_result:
+        _drop_cache_entry(key, future)
+    future.set_result(result)
+    return result
+
+async def fetch_page(session, url, timeout=10):
+    """Fetch HTML content, sharing one request between concurrent callers of the same URL"""
+    # Page bodies are large and the disk cache already covers reuse, so they
+    # are not kept in memory once fetched
+    return await _shared_fetch(('page', url), lambda: _do_fetch(session, url, timeout), keep_result=False)
+
+async def _do_fetch_email(session, url, timeout=10):
+    """Stream a page and return the first email in it, aborting the download on a match"""
+    try:
+        async with request_slot(url):
+            logger.info(f"Scanning for email: {url}")
+            async with session.get(url, headers=get_headers(),
+                                   timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+                response.raise_for_status()
+                
+                buf = bytearray()
+                scanned = 0
+                async for chunk in response.content.iter_chunked(EMAIL_SCAN_CHUNK_SIZE):
+                    buf.extend(chunk)
+                    if len(buf) - scanned < EMAIL_SCAN_INTERVAL:
+                        continue
+                    
+                    # latin-1 maps bytes 1:1, so ASCII emails decode unchanged
+                    window = buf[scanned:].decode('latin-1')
+                    match = EMAIL_RE.search(window)
+                    if match and match.end() < len(window):
+                        return match.group(0)
+                    
+                    # A match running to the end of the buffer may be cut off
+                    # (e.g. ".co" of ".company"); rescan it once more has arrived
+                    scanned = scanned + match.start() if match else len(buf) - EMAIL_SCAN_OVERLAP
+                    
+                    if len(buf) >= EMAIL_SCAN_MAX_BYTES:
+                        return None
+                
+                return extract_email_from_text(buf[scanned:].decode('latin-1'))
+    except aiohttp.ClientResponseError as e:
+        # Most sites lack some of the probed contact pages; a 4xx is expected
+        if 400 <= e.status < 500:
+            logger.debug(f"No page at {url}: {e.status}")
+        else:
+            logger.error(f"Error fetching {url}: {e}")
+        return None
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        logger.error(f"Error fetching {url}: {e}")
+        return None
+
+async def fetch_email(session, url, timeout=10):
+    """Find the first email on a page without downloading more of it than needed"""
+    return await _shared_fetch(('email', url), lambda: _do_fetch_email(session, url, timeout))
+
+async def find_email(session, website):
+    """Find an email on a business website, trying its likely contact pages in turn"""
+    # Relative listing links and tel:/mailto: hrefs have no host to fetch from
+    if urlparse(website).scheme not in ('http', 'https'):
+        return None
+    
+    # The pages share a host, so the per-domain limiter would space them out
+    # anyway; trying them in order lets us stop at the first hit
+    for path in CONTACT_PATHS:
+        email = await fetch_email(session, urljoin(website, path))
+        if email:
+            return email
     return None
 
-def extract_phone_from_text(text):
-    """Extract phone number from text"""
+async def fetch_emails(session, urls):
+    """Look up emails for several websites concurrently (None where missing or failed)"""
+    results = iter(await asyncio.gather(
+        *[find_email(session, url) for url in urls if url],
+        return_exceptions=True
+    ))
+    
+    emails = []
+    for url in urls:
+        email = next(results) if url else None
+        emails.append(email if isinstance(email, str) else None)
+    return emails
+
+def extract_email_from_text(text):
+    """Extract first email found in text"""
     if not text:
         return None
     
-    # Phone patterns for US/Canada
-    phone_patterns = [
-        r"\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}",
-        r"\+1[-.\s]?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}",
-        r"\d{3}[-.\s]\d{3}[-.\s]\d{4}"
-    ]
+    match = EMAIL_RE.search(text)
+    return match.group(0) if match else None
+
+def extract_mailto_email(node):
+    """Extract the email from the first mailto: link under node"""
+    link = MAILTO_SEL.select_one(node)
+    return extract_email_from_text(link.get('href')) if link else None
+
+def extract_contacts_from_text(text):
+    """Extract first email and first phone number from text in one pass"""
+    email = phone = None
+    if not text:
+        return email, phone
     
-    for pattern in phone_patterns:
-        phones = re.findall(pattern, text)
-        if phones:
-            return phones[0]
+    for match in CONTACT_RE.finditer(text):
+        if match.lastgroup == 'email' and not email:
+            email = match.group()
+        elif match.lastgroup == 'phone' and not phone:
+            phone = match.group()
+        if email and phone:
+            break
+    return email, phone
+
+def select_first(node, selectors):
+    """Return the first element matched by the compiled selectors, tried in order"""
+    for selector in selectors:
+        elem = selector.select_one(node)
+        if elem is not None:
+            return elem
     return None
 
+def select_all(node, selectors):
+    """Return all elements matched by the first compiled selector that matches any"""
+    for selector in selectors:
+        elems = selector.select(node)
+        if elems:
+            return elems
+    return []
+
 def clean_text(text):
     """Clean and normalize text"""
     if not text:
         return ""
-    return re.sub(r'\s+', ' ', text.strip())
+    return WS_RE.sub(' ', text.strip())
 
-def scrape_yellowpages_us(category, location):
+async def scrape_yellowpages_us(session, website_session, category, location):
     """Scrape YellowPages.com for US businesses"""
     businesses = []
     try:
-        # Format search terms for URL
-        search_terms = quote_plus(category)
-        geo_location = quote_plus(f"{location}, United States")
-        
-        url = f"https://www.yellowpages.com/search?search_terms={search_terms}&geo_location_terms={geo_location}"
-        html = fetch_page(url)
+        url = url_for("yellowpages_us", category, f"{location}, United States")
+        html = await fetch_page(session, url)
         
         if not html:
             return businesses
         
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = BeautifulSoup(html, HTML_PARSER)
         
         # YellowPages structure - look for business listings
-        listings = soup.find_all('div', class_='info')
+        listings = YP_US_LISTING_SEL.select(soup)
         
+        parsed = []
         for listing in listings[:15]:  # Get more than 10 to filter
             try:
                 # Extract business name
-                name_elem = listing.find('a', class_='business-name') or listing.find('h2') or listing.find('h3')
+                name_elem = select_first(listing, YP_US_NAME_SELS)
                 if not name_elem:
                     continue
                 
@@ -187,44 +484,52 @@ def scrape_yellowpages_us(category, location):
                     continue
                 
                 # Extract phone
-                phone_elem = listing.find('div', class_='phones phone primary') or listing.find('div', class_='phone')
+                phone_elem = select_first(listing, YP_US_PHONE_SELS)
                 phone = clean_text(phone_elem.get_text()) if phone_elem else None
                 
                 # Extract website
-                website_elem = listing.find('a', class_='track-visit-website') or listing.find('a', href=True)
+                website_elem = select_first(listing, YP_US_WEBSITE_SELS)
                 website = website_elem.get('href') if website_elem else None
                 
                 # Extract address
-                address_elem = listing.find('div', class_='street-address') or listing.find('span', class_='street-address')
+                address_elem = YP_US_ADDRESS_SEL.select_one(listing)
                 address = clean_text(address_elem.get_text()) if address_elem else None
                 
-                # Try to get email from website or listing
-                email = None
-                if website:
-                    try:
-                        website_html = fetch_page(website)
-                        if website_html:
-                            email = extract_email_from_text(website_html)
-                    except:
-                        pass
+                parsed.append((listing, business_name, phone, website, address))
                 
+            except Exception as e:
+                logger.error(f"Error parsing listing: {e}")
+                continue
+        
+        # Fetch all websites together; they are on different hosts, so the
+        # per-domain limiter lets them overlap
+        website_emails = await fetch_emails(website_session, [row[3] for row in parsed])
+        
+        for (listing, business_name, phone, website, address), email in zip(parsed, website_emails):
+            try:
                 # If no email from website, try to find in listing itself
+                if not email:
+                    # Check mailto: links first, which get_text() drops; other
+                    # attributes are not scanned (image names like logo@2x.png
+                    # look like emails)
+                    email = extract_mailto_email(listing)
                 if not email:
                     listing_text = listing.get_text()
-                    email = extract_email_from_text(listing_text)
+                    email, listing_phone = extract_contacts_from_text(listing_text)
+                    phone = phone or listing_phone
                 
                 # Skip if no email (mandatory field)
                 if not email:
                     continue
                 
-                businesses.append({
-                    "Business Name": business_name,
-                    "Email": email,
-                    "Phone": phone or "",
-                    "Website": website or "",
-                    "Address": address or "",
-                    "Category": category
-                })
+                businesses.append(Business(
+                    name=business_name,
+                    email=email,
+                    phone=phone or "",
+                    website=website or "",
+                    address=address or "",
+                    category=category
+                ))
                 
                 if len(businesses) >= 10:
                     break
@@ -238,29 +543,26 @@ def scrape_yellowpages_us(category, location):
     
     return businesses
 
-def scrape_yellowpages_ca(category, location):
+async def scrape_yellowpages_ca(session, website_session, category, location):
     """Scrape YellowPages.ca for Canadian businesses"""
     businesses = []
     try:
-        # Format search terms for URL
-        search_terms = quote_plus(category)
-        geo_location = quote_plus(f"{location}, Canada")
-        
-        url = f"https://www.yellowpages.ca/search/si/1/{search_terms}/{geo_location}"
-        html = fetch_page(url)
+        url = url_for("yellowpages_ca", category, f"{location}, Canada")
+        html = await fetch_page(session, url)
         
         if not html:
             return businesses
         
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = BeautifulSoup(html, HTML_PARSER)
         
         # YellowPages.ca structure
-        listings = soup.find_all('div', class_='listing') or soup.find_all('div', class_='listing__content')
+        listings = select_all(soup, YP_CA_LISTING_SELS)
         
+        parsed = []
         for listing in listings[:15]:  # Get more than 10 to filter
             try:
                 # Extract business name
-                name_elem = listing.find('h3', class_='listing__name') or listing.find('a', class_='listing__name--link')
+                name_elem = select_first(listing, YP_CA_NAME_SELS)
                 if not name_elem:
                     continue
                 
@@ -269,43 +571,51 @@ def scrape_yellowpages_ca(category, location):
                     continue
                 
                 # Extract phone
-                phone_elem = listing.find('a', class_='phone') or listing.find('div', class_='listing__phone')
+                phone_elem = select_first(listing, YP_CA_PHONE_SELS)
                 phone = clean_text(phone_elem.get_text()) if phone_elem else None
                 
                 # Extract website
-                website_elem = listing.find('a', class_='listing__website') or listing.find('a', string=re.compile(r'website', re.I))
+                website_elem = YP_CA_WEBSITE_SEL.select_one(listing) or listing.find('a', string=WEBSITE_RE)
                 website = website_elem.get('href') if website_elem else None
                 
                 # Extract address
-                address_elem = listing.find('div', class_='listing__address') or listing.find('span', class_='address')
+                address_elem = select_first(listing, YP_CA_ADDRESS_SELS)
                 address = clean_text(address_elem.get_text()) if address_elem else None
                 
-                # Try to get email
-                email = None
-                if website:
-                    try:
-                        website_html = fetch_page(website)
-                        if website_html:
-                            email = extract_email_from_text(website_html)
-                    except:
-                        pass
+                parsed.append((listing, business_name, phone, website, address))
                 
+            except Exception as e:
+                logger.error(f"Error parsing listing: {e}")
+                continue
+        
+        # Fetch all websites together; they are on different hosts, so the
+        # per-domain limiter lets them overlap
+        website_emails = await fetch_emails(website_session, [row[3] for row in parsed])
+        
+        for (listing, business_name, phone, website, address), email in zip(parsed, website_emails):
+            try:
+                if not email:
+                    # Check mailto: links first, which get_text() drops; other
+                    # attributes are not scanned (image names like logo@2x.png
+                    # look like emails)
+                    email = extract_mailto_email(listing)
                 if not email:
                     listing_text = listing.get_text()
-                    email = extract_email_from_text(listing_text)
+                    email, listing_phone = extract_contacts_from_text(listing_text)
+                    phone = phone or listing_phone
                 
                 # Skip if no email (mandatory field)
                 if not email:
                     continue
                 
-                businesses.append({
-                    "Business Name": business_name,
-                    "Email": email,
-                    "Phone": phone or "",
-                    "Website": website or "",
-                    "Address": address or "",
-                    "Category": category
-                })
+                businesses.append(Business(
+                    name=business_name,
+                    email=email,
+                    phone=phone or "",
+                    website=website or "",
+                    address=address or "",
+                    category=category
+                ))
                 
                 if len(businesses) >= 10:
                     break
@@ -319,26 +629,26 @@ def scrape_yellowpages_ca(category, location):
     
     return businesses
 
-def scrape_yelp(category, location, is_canada=False):
+async def scrape_yelp(session, category, location, is_canada=False):
     """Scrape Yelp for businesses"""
     businesses = []
     try:
         base_url = "https://www.yelp.ca" if is_canada else "https://www.yelp.com"
-        search_url = f"{base_url}/search?find_desc={quote_plus(category)}&find_loc={quote_plus(location)}"
+        search_url = url_for("yelp_ca" if is_canada else "yelp_us", category, location)
         
-        html = fetch_page(search_url)
+        html = await fetch_page(session, search_url)
         if not html:
             return businesses
         
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = BeautifulSoup(html, HTML_PARSER)
         
         # Yelp business listings
-        listings = soup.find_all('div', {'data-testid': 'serp-ia-card'}) or soup.find_all('li', class_='regular-search-result')
+        listings = select_all(soup, YELP_LISTING_SELS)
         
         for listing in listings[:15]:
             try:
                 # Business name
-                name_elem = listing.find('a', class_='css-1m051bw') or listing.find('span', class_='css-1egxyvc')
+                name_elem = select_first(listing, YELP_NAME_SELS)
                 if not name_elem:
                     continue
                     
@@ -352,9 +662,9 @@ def scrape_yelp(category, location, is_canada=False):
                     if business_link.startswith('/'):
                         business_link = base_url + business_link
                     
-                    business_html = fetch_page(business_link)
+                    business_html = await fetch_page(session, business_link)
                     if business_html:
-                        business_soup = BeautifulSoup(business_html, 'html.parser')
+                        business_soup = BeautifulSoup(business_html, HTML_PARSER)
                         
                         # Extract email from business page
                         email = extract_email_from_text(business_html)
@@ -362,25 +672,25 @@ def scrape_yelp(category, location, is_canada=False):
                             continue
                         
                         # Extract phone
-                        phone_elem = business_soup.find('p', string=re.compile(r'\(\d{3}\)')) or business_soup.find('span', string=re.compile(r'\d{3}-\d{3}-\d{4}'))
+                        phone_elem = business_soup.find('p', string=PHONE_PAREN_RE) or business_soup.find('span', string=PHONE_DASH_RE)
                         phone = clean_text(phone_elem.get_text()) if phone_elem else ""
                         
                         # Extract website
-                        website_elem = business_soup.find('a', string=re.compile(r'website', re.I)) or business_soup.find('a', href=re.compile(r'biz_redir'))
+                        website_elem = business_soup.find('a', string=WEBSITE_RE) or business_soup.find('a', href=BIZ_REDIR_RE)
                         website = website_elem.get('href') if website_elem else ""
                         
                         # Extract address
-                        address_elem = business_soup.find('address') or business_soup.find('p', string=re.compile(r'\d+.*(?:St|Ave|Rd|Blvd|Dr|Ln)'))
+                        address_elem = business_soup.find('address') or business_soup.find('p', string=STREET_RE)
                         address = clean_text(address_elem.get_text()) if address_elem else ""
                         
-                        businesses.append({
-                            "Business Name": business_name,
-                            "Email": email,
-                            "Phone": phone,
-                            "Website": website,
-                            "Address": address,
-                            "Category": category
-                        })
+                        businesses.append(Business(
+                            name=business_name,
+                            email=email,
+                            phone=phone,
+                            website=website,
+                            address=address,
+                            category=category
+                        ))
                         
                         if len(businesses) >= 10:
                             break
@@ -394,8 +704,8 @@ def scrape_yelp(category, location, is_canada=False):
     
     return businesses
 
-def scrape_category_for_region(category, region_key, region_config):
-    """Scrape a specific category for a region using multiple sources"""
+async def scrape_category_for_region(session, website_session, category, region_key, region_config):
+    """Scrape a specific category for a region; returns (candidates, whether Yelp was tried)"""
     logger.info(f"Scraping {category} in {region_config['name']}...")
     all_businesses = []
     
@@ -404,95 +714,125 @@ def scrape_category_for_region(category, region_key, region_config):
     
     # Try YellowPages first
     if is_canada:
-        businesses = scrape_yellowpages_ca(category, location)
+        businesses = await scrape_yellowpages_ca(session, website_session, category, location)
     else:
-        businesses = scrape_yellowpages_us(category, location)
+        businesses = await scrape_yellowpages_us(session, website_session, category, location)
     
     all_businesses.extend(businesses)
     
     # If we don't have enough, try Yelp
-    if len(all_businesses) < 10:
-        yelp_businesses = scrape_yelp(category, location, is_canada)
+    tried_yelp = len(all_businesses) < 10
+    if tried_yelp:
+        yelp_businesses = await scrape_yelp(session, category, location, is_canada)
         all_businesses.extend(yelp_businesses)
     
-    # Remove duplicates based on business name and email
-    unique_businesses = []
-    seen = set()
-    
-    for business in all_businesses:
-        identifier = (business['Business Name'].lower(), business['Email'].lower())
+    # Duplicates are removed region-wide in scrape_region
+    return all_businesses, tried_yelp
+
+def take_unique(candidates, seen, limit):
+    """Return up to limit candidates not already in seen, marking them as seen"""
+    unique = []
+    for business in candidates:
+        if len(unique) >= limit:
+            break
+        identifier = business.name.casefold() + "\x1f" + business.email.casefold()
         if identifier not in seen:
             seen.add(identifier)
-            unique_businesses.append(business)
-    
-    # Limit to 10 businesses per category
-    unique_businesses = unique_businesses[:10]
-    
-    logger.info(f"Found {len(unique_businesses)} businesses for {category} in {region_config['name']}")
-    
-    return unique_businesses
+            unique.append(business)
+    return unique
 
-def scrape_region(region_key, region_config):
-    """Scrape all categories for a given region"""
-    all_results = []
+async def scrape_region(session, website_session, region_key, region_config):
+    """Scrape all categories for a given region, streaming rows to a Parquet file"""
+    path = f"{region_key}_businesses.parquet"
     
     logger.info(f"Starting to scrape {region_config['name']}, {region_config['country']}")
     
-    for category in CATEGORIES:
-        businesses = scrape_category_for_region(category, region_key, region_config)
-        
-        # Validation: Check if we have at least 10 businesses
-        if len(businesses) < 10:
-            # Add note about insufficient records
-            businesses.append({
-                "Business Name": f"Less than 10 records available for {category}",
-                "Email": "",
-                "Phone": "",
-                "Website": "",
-                "Address": "",
-                "Category": category
-            })
-            logger.warning(f"Only found {len(businesses)-1} businesses for {category} in {region_config['name']}")
-        
-        all_results.extend(businesses)
-        
-        # Small delay between categories
-        time.sleep(random.uniform(2, 4))
+    # Categories run concurrently; politeness is enforced per domain in fetch_page
+    tasks = [
+        asyncio.ensure_future(scrape_category_for_region(session, website_session, category, region_key, region_config))
+        for category in CATEGORIES
+    ]
     
-    return all_results
+    # Duplicates (by business name and email) are removed across the whole
+    # region, in category order, so a business is only listed once
+    seen = set()
+    
+    try:
+        # Each category is written as soon as it and those before it are done,
+        # so rows don't pile up in memory. The writer closes (writing the
+        # Parquet footer) on exceptions too, so categories already written
+        # stay readable after an error - but not after the process is killed
+        with pq.ParquetWriter(path, PARQUET_SCHEMA) as writer:
+            for category, task in zip(CATEGORIES, tasks):
+                candidates, tried_yelp = await task
+                
+                # Limit to 10 businesses per category
+                businesses = take_unique(candidates, seen, 10)
+                
+                # YellowPages alone looked like enough, but some of its hits were
+                # already listed under earlier categories, so fill up from Yelp
+                if len(businesses) < 10 and not tried_yelp:
+                    yelp_businesses = await scrape_yelp(
+                        session, category, region_config['name'], region_config['country'] == 'Canada'
+                    )
+                    businesses.extend(take_unique(yelp_businesses, seen, 10 - len(businesses)))
+                
+                logger.info(f"Found {len(businesses)} businesses for {category} in {region_config['name']}")
+                
+                # Validation: Check if we have at least 10 businesses
+                if len(businesses) < 10:
+                    # Add note about insufficient records
+                    businesses.append(Business(
+                        name=f"Less than 10 records available for {category}",
+                        email="",
+                        phone="",
+                        website="",
+                        address="",
+                        category=category
+                    ))
+                    logger.warning(f"Only found {len(businesses)-1} businesses for {category} in {region_config['name']}")
+                
+                # Transpose the records into columns for Arrow
+                writer.write_table(pa.Table.from_arrays(
+                    [pa.array(column, pa.string()) for column in zip(*businesses)],
+                    schema=PARQUET_SCHEMA
+                ))
+    finally:
+        # Don't leave categories scraping in the background if writing failed
+        for task in tasks:
+            task.cancel()
+    
+    return path
 
-def save_to_excel(data, filename):
-    """Save scraped data to Excel with proper formatting"""
-    if not data:
+def save_to_excel(table, filename):
+    """Save a pyarrow Table of scraped data to Excel with proper formatting"""
+    if table.num_rows == 0:
         logger.warning(f"No data to save for {filename}")
         return
     
     try:
-        df = pd.DataFrame(data)
-        
-        # Reorder columns to match requirements
-        column_order = ["Business Name", "Email", "Phone", "Website", "Address", "Category"]
-        df = df[column_order]
-        
-        # Save to Excel
-        with pd.ExcelWriter(filename, engine='openpyxl') as writer:
-            df.to_excel(writer, sheet_name='Businesses', index=False)
+        # constant_memory flushes each row to disk as soon as it is written;
+        # strings_to_urls is off so websites stay plain text (xlsxwriter
+        # rejects URLs over 2079 characters and would drop the rest of the row)
+        with xlsxwriter.Workbook(filename, {'constant_memory': True, 'strings_to_urls': False}) as workbook:
+            worksheet = workbook.add_worksheet('Businesses')
+            
+            # Auto-adjust column widths from the longest value (or header)
+            for col, column in enumerate(table.column_names):
+                max_length = max(pc.max(pc.utf8_length(table[column])).as_py() or 0, len(column))
+                worksheet.set_column(col, col, min(max_length + 2, 50))
+            
+            worksheet.write_row(0, 0, table.column_names, workbook.add_format({'bold': True}))
             
-            # Auto-adjust column widths
-            worksheet = writer.sheets['Businesses']
-            for column in worksheet.columns:
-                max_length = 0
-                column_letter = column[0].column_letter
-                for cell in column:
-                    try:
-                        if len(str(cell.value)) > max_length:
-                            max_length = len(str(cell.value))
-                    except:
-                        pass
-                adjusted_width = min(max_length + 2, 50)
-                worksheet.column_dimensions[column_letter].width = adjusted_width
+            row = 1
+            for batch in table.to_batches():
+                for values in zip(*batch.to_pydict().values()):
+                    # write_row stops at the first cell it cannot write
+                    if worksheet.write_row(row, 0, values):
+                        logger.warning(f"Could not fully write row {row} of {filename}")
+                    row += 1
         
-        logger.info(f"Successfully saved {len(data)} records to {filename}")
+        logger.info(f"Successfully saved {table.num_rows} records to {filename}")
         
     except Exception as e:
         logger.error(f"Error saving to Excel: {e}")
@@ -501,32 +841,83 @@ def save_to_excel(data, filename):
 # MAIN SCRIPT
 # -----------------------------
 
-def main():
-    """Main function to run the scraper"""
+async def process_region(session, website_session, region_key, region_config):
+    """Scrape one region and save it to Excel"""
+    logger.info(f"\n{'='*50}")
+    logger.info(f"Processing region: {region_config['name']}, {region_config['country']}")
+    logger.info(f"{'='*50}")
+    
+    try:
+        # Scrape all data for the region
+        parquet_path = await scrape_region(session, website_session, region_key, region_config)
+        
+        # Save to Excel in a worker thread so the other region's requests
+        # keep flowing while the workbook is written
+        filename = f"{region_key}_businesses.xlsx"
+        table = await asyncio.to_thread(pq.read_table, parquet_path)
+        await asyncio.to_thread(save_to_excel, table, filename)
+        
+        logger.info(f"Completed scraping for {region_config['name']}")
+        
+    except Exception as e:
+        logger.error(f"Error processing region {region_key}: {e}")
+
+async def main_async(refresh_cache=False):
+    """Scrape every region using HTTP sessions that share one connection pool"""
     logger.info("Starting Business Directory Web Scraper")
     
-    for region_key, region_config in REGIONS.items():
-        logger.info(f"\n{'='*50}")
-        logger.info(f"Processing region: {region_config['name']}, {region_config['country']}")
-        logger.info(f"{'='*50}")
+    # One pooled connector for the whole run, so TLS handshakes and DNS
+    # lookups are reused across every request to the same host
+    connector = aiohttp.TCPConnector(
+        limit=20,
+        limit_per_host=2,
+        ttl_dns_cache=300,
+        keepalive_timeout=30,  # Outlasts DOMAIN_DELAY between hits to a host
+        enable_cleanup_closed=True
+    )
+    session = CachedSession(
+        cache=SQLiteBackend(CACHE_PATH, expire_after=CACHE_EXPIRE_AFTER),
+        connector=connector,
+        headers=SESSION_HEADERS
+    )
+    
+    # Business websites are only streamed for an email, so they bypass the
+    # cache, which would read (and store) every page in full before
+    # fetch_email could stop early; the connector is shared but owned above
+    website_session = aiohttp.ClientSession(
+        connector=connector,
+        connector_owner=False,
+        headers=SESSION_HEADERS
+    )
+    
+    async with session, website_session:
+        if refresh_cache:
+            # Forced refresh: drop everything cached so every page is fetched
+            # from the network and stored again
+            logger.info(f"Clearing {CACHE_PATH}")
+            await session.cache.clear()
         
-        try:
-            # Scrape all data for the region
-            region_data = scrape_region(region_key, region_config)
-            
-            # Save to Excel
-            filename = f"{region_key}_businesses.xlsx"
-            save_to_excel(region_data, filename)
-            
-            logger.info(f"Completed scraping for {region_config['name']}")
-            
-        except Exception as e:
-            logger.error(f"Error processing region {region_key}: {e}")
-            continue
+        # Regions share no hosts, so they are scraped concurrently
+        await asyncio.gather(*[
+            process_region(session, website_session, region_key, region_config)
+            for region_key, region_config in REGIONS.items()
+        ])
     
     logger.info("\nScraping completed! Check the generated Excel files:")
     logger.info("- kansas_businesses.xlsx")
     logger.info("- nunavut_businesses.xlsx")
 
+def parse_args():
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="Business Directory Web Scraper")
+    parser.add_argument("--no-cache", action="store_true",
+                        help=f"clear {CACHE_PATH} first, forcing every page to be refetched")
+    return parser.parse_args()
+
+def main():
+    """Main function to run the scraper"""
+    args = parse_args()
+    asyncio.run(main_async(refresh_cache=args.no_cache))
+
 if __name__ == "__main__":
     main()